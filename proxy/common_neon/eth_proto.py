@@ -83,7 +83,10 @@ class NeonTx(rlp.Serializable):
     @classmethod
     def from_string(cls, s) -> NeonTx:
         try:
-            return rlp.decode(s, NeonTx)
+            tx = rlp.decode(s, NeonTx)
+            # the signature of a signed tx is the hash of its raw data, so there is no need to encode it again
+            tx._tx_sig = keccak_256(s).digest()
+            return tx
         except rlp.exceptions.ObjectDeserializationError as err:
             if (not err.list_exception) or (len(err.list_exception.serial) != 6):
                 raise
@@ -72,7 +72,8 @@ class OpSecretMng:
         LOG.debug(f"Open a secret file: {name}")
         with open(name.strip(), mode='r') as d:
             pkey = (d.read())
-            num_list = [int(v) for v in pkey.strip("[] \n").split(',') if 0 <= int(v) <= 255]
+            value_list = [int(v) for v in pkey.strip("[] \n").split(',')]
+            num_list = [v for v in value_list if 0 <= v <= 255]
             if len(num_list) < 32:
                 LOG.debug(f'Wrong content in the file {name}')
                 return None
@@ -9,6 +9,7 @@ from typing import Dict, Union, Any, List, Optional, Set, cast
 import logging
 import base58
 import requests
+import requests.adapters
 
 from ..common_neon.address import NeonAddress, neon_2program
 from ..common_neon.config import Config
@@ -59,11 +60,17 @@ class SolBlockStatus:
 
 
 class SolInteractor:
+    # should be not less than NeonRpcApiPlugin.BATCH_POOL_SIZE, otherwise keep-alive connections are dropped
+    _http_pool_size = 64
+
     def __init__(self, config: Config, solana_url: str) -> None:
         self._config = config
         self._request_cnt = itertools.count()
         self._endpoint_uri = solana_url
         self._session = requests.sessions.Session()
+        http_adapter = requests.adapters.HTTPAdapter(pool_maxsize=self._http_pool_size)
+        self._session.mount('http://', http_adapter)
+        self._session.mount('https://', http_adapter)
 
     def _simple_send_post_request(self, request) -> requests.Response:
         headers = {
@@ -371,7 +378,7 @@ class SolInteractor:
     def _decode_block_info(block_slot: int, net_block: Dict[str, Any]) -> SolBlockInfo:
         return SolBlockInfo(
             block_slot=block_slot,
-            block_hash='0x' + base58.b58decode(net_block.get('blockhash', '')).hex().lower(),
+            block_hash='0x' + base58.b58decode(net_block.get('blockhash', '')).hex(),
             block_time=net_block.get('blockTime', None),
             block_height=net_block.get('blockHeight', None),
             parent_block_slot=net_block.get('parentSlot', None)
@@ -3,3 +3,4 @@ from .solana_block import SolBlockInfo
 from .neon_tx_info import NeonTxInfo
 from .neon_tx_result_info import NeonTxResultInfo
 from .neon_tx_receipt_info import NeonTxReceiptInfo
+from .lru_dict import LRUDict
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import threading
+
+from collections import OrderedDict
+from typing import TypeVar, Generic, Optional
+
+
+LRUDictKey = TypeVar('LRUDictKey')
+LRUDictValue = TypeVar('LRUDictValue')
+
+
+class LRUDict(Generic[LRUDictKey, LRUDictValue]):
+    """Thread-safe dictionary, which keeps only the most recently used values"""
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._dict: OrderedDict[LRUDictKey, LRUDictValue] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def get(self, key: LRUDictKey) -> Optional[LRUDictValue]:
+        with self._lock:
+            value = self._dict.get(key, None)
+            if value is not None:
+                self._dict.move_to_end(key)
+            return value
+
+    def put(self, key: LRUDictKey, value: LRUDictValue) -> None:
+        with self._lock:
+            self._dict[key] = value
+            self._dict.move_to_end(key)
+            if len(self._dict) > self._max_size:
+                self._dict.popitem(last=False)
@@ -23,6 +23,7 @@ class BaseDB:
         self._blocks_table_name = 'solana_blocks'
         self._column_list: List[str] = column_list
         self._column_dict: Dict[str, int] = {name: idx for idx, name in enumerate(column_list)}
+        self._a_column_list_sql = ','.join(['a.' + c for c in column_list])
         self._conn = psycopg2.connect(
             dbname=POSTGRES_DB,
             user=POSTGRES_USER,
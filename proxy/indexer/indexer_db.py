@@ -1,4 +1,4 @@
-from typing import Optional, Iterator, List, Dict, Any
+from typing import Optional, Iterator, List, Dict, Any, Tuple
 
 from ..common_neon.utils import NeonTxReceiptInfo, SolBlockInfo
 
@@ -102,7 +102,8 @@ class IndexerDB:
         block_slot = self.get_latest_block_slot()
         if block_slot == 0:
             return SolBlockInfo(block_slot=0)
-        return self.get_block_by_slot(block_slot)
+        # the latest slot is already known, don't read it again from the constants table
+        return self._sol_blocks_db.get_block_by_slot(block_slot, block_slot)
 
     def get_latest_block_slot(self) -> int:
         return self._constants_db['latest_block_slot']
@@ -146,6 +147,9 @@ class IndexerDB:
     def get_tx_list_by_block_slot(self, block_slot: int) -> List[NeonTxReceiptInfo]:
         return self._neon_txs_db.get_tx_list_by_block_slot(block_slot)
 
+    def get_tx_sig_gas_list_by_block_slot(self, block_slot: int) -> List[Tuple[str, str]]:
+        return self._neon_txs_db.get_tx_sig_gas_list_by_block_slot(block_slot)
+
     def get_tx_by_neon_sig(self, neon_sig: str) -> Optional[NeonTxReceiptInfo]:
         return self._neon_txs_db.get_tx_by_neon_sig(neon_sig)
 
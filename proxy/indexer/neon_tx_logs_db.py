@@ -123,7 +123,7 @@ class NeonTxLogsDB(BaseDB):
             param_list += address_list
 
         query_string = f'''
-            SELECT {",".join(['a.' + c for c in self._column_list])},
+            SELECT {self._a_column_list_sql},
                    b.block_hash
               FROM {self._table_name} AS a
         INNER JOIN {self._blocks_table_name} AS b
@@ -150,7 +150,7 @@ class NeonTxLogsDB(BaseDB):
             DELETE FROM {self._table_name}
                   WHERE block_slot > %s
                     AND block_slot < %s
-                    AND block_slot NOT IN ({','.join(["%s" for _ in block_slot_list])})
+                    AND block_slot <> ALL(%s)
             ''',
-            [base_block_slot, block_slot_list[-1]] + block_slot_list
+            (base_block_slot, block_slot_list[-1], block_slot_list)
         )
@@ -1,4 +1,4 @@
-from typing import Optional, List, Any, Iterator
+from typing import Optional, List, Any, Iterator, Tuple
 
 from ..common_neon.utils import NeonTxResultInfo, NeonTxInfo, NeonTxReceiptInfo
 
@@ -16,6 +16,7 @@ class NeonTxsDB(BaseDB):
                 'calldata', 'v', 'r', 's', 'status', 'gas_used', 'logs'
             ]
         )
+        self._base_request = self._build_request()
 
     def _tx_from_value(self, value_list: Optional[List[Any]]) -> Optional[NeonTxReceiptInfo]:
         if not value_list:
@@ -71,7 +72,7 @@ class NeonTxsDB(BaseDB):
 
     def _build_request(self) -> str:
         return f'''
-            SELECT {",".join(['a.' + c for c in self._column_list])},
+            SELECT {self._a_column_list_sql},
                    b.block_hash
               FROM {self._table_name} AS a
         INNER JOIN {self._blocks_table_name} AS b
@@ -79,7 +80,7 @@ class NeonTxsDB(BaseDB):
         '''
 
     def get_tx_by_neon_sig(self, neon_sig: str) -> Optional[NeonTxReceiptInfo]:
-        request = self._build_request() + '''
+        request = self._base_request + '''
                AND b.is_active = True
              WHERE a.neon_sig = %s
         '''
@@ -88,7 +89,7 @@ class NeonTxsDB(BaseDB):
             return self._tx_from_value(cursor.fetchone())
 
     def get_tx_list_by_block_slot(self, block_slot: int) -> List[NeonTxReceiptInfo]:
-        request = self._build_request() + '''
+        request = self._base_request + '''
              WHERE a.block_slot = %s
           ORDER BY a.tx_idx ASC
         '''
@@ -101,8 +102,19 @@ class NeonTxsDB(BaseDB):
 
         return [self._tx_from_value(value_list) for value_list in row_list if value_list is not None]
 
+    def get_tx_sig_gas_list_by_block_slot(self, block_slot: int) -> List[Tuple[str, str]]:
+        request = f'''
+            SELECT neon_sig, gas_used
+              FROM {self._table_name}
+             WHERE block_slot = %s
+          ORDER BY tx_idx ASC
+        '''
+        with self._conn.cursor() as cursor:
+            cursor.execute(request, (block_slot,))
+            return cursor.fetchall()
+
     def get_tx_by_block_slot_tx_idx(self, block_slot: int, tx_idx: int) -> Optional[NeonTxReceiptInfo]:
-        request = self._build_request() + '''
+        request = self._base_request + '''
              WHERE a.block_slot = %s
                AND a.tx_idx = %s
         '''
@@ -115,7 +127,7 @@ class NeonTxsDB(BaseDB):
             DELETE FROM {self._table_name}
                   WHERE block_slot > %s
                     AND block_slot < %s
-                    AND block_slot NOT IN ({','.join(["%s" for _ in block_slot_list])})
+                    AND block_slot <> ALL(%s)
             ''',
-            [base_block_slot, block_slot_list[-1]] + block_slot_list
+            (base_block_slot, block_slot_list[-1], block_slot_list)
         )
@@ -1,18 +1,36 @@
-import math
+from __future__ import annotations
+
 import logging
 
-from typing import Optional, List, Any, Iterator
+from dataclasses import replace
+from functools import lru_cache
+from typing import Optional, List, Any, Iterator, Tuple
 
-from ..common_neon.utils import SolBlockInfo
+from ..common_neon.utils import SolBlockInfo, LRUDict
 from ..indexer.base_db import BaseDB
 from ..common_neon.config import Config
 
 
 LOG = logging.getLogger(__name__)
 
+# Templates of fake block hashes, indexed by the byte length of the block slot
+_FAKE_BLOCK_HASH_FMT_LIST = tuple(
+    '0x' + 'f' * (62 - (byte_len << 1)) + '00{:0' + str(byte_len << 1) + 'x}'
+    for byte_len in range(32)
+)
+
 
 class SolBlocksDB(BaseDB):
-    _one_block_sec = 0.4
+    # one block is 0.4 sec = 2/5 sec
+    _one_block_sec_num = 2
+    _one_block_sec_den = 5
+    _cache_size = 4096
+    _get_block_by_slot_stmt = 'sol_blocks_get_block_by_slot'
+    _get_block_by_hash_stmt = 'sol_blocks_get_block_by_hash'
+    _finalize_block_list_stmt = 'sol_blocks_finalize_block_list'
+    _delete_inactive_block_list_stmt = 'sol_blocks_delete_inactive_block_list'
+    _deactivate_block_list_stmt = 'sol_blocks_deactivate_block_list'
+    _activate_block_list_stmt = 'sol_blocks_activate_block_list'
 
     def __init__(self, config: Config):
         super().__init__(
@@ -22,27 +40,46 @@ class SolBlocksDB(BaseDB):
             ]
         )
         self._config = config
+        # finalized blocks never change, so they don't need any invalidation
+        self._fake_block_time_cache: LRUDict[int, int] = LRUDict(self._cache_size)
+        self._finalized_block_by_slot_cache: LRUDict[int, SolBlockInfo] = LRUDict(self._cache_size)
+        self._finalized_block_by_hash_cache: LRUDict[str, SolBlockInfo] = LRUDict(self._cache_size)
+        self._prepare_request_list()
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _generate_fake_block_hash(block_slot: int) -> str:
         if block_slot < 0:
             return '0x' + '0' * 64
 
-        hex_num = hex(block_slot)[2:]
-        num_len = len(hex_num)
-        hex_num = '00' + hex_num.rjust(((num_len >> 1) + (num_len % 2)) << 1, '0')
-        return '0x' + hex_num.rjust(64, 'f')
+        byte_len = ((block_slot.bit_length() + 7) >> 3) or 1
+        return _FAKE_BLOCK_HASH_FMT_LIST[byte_len].format(block_slot)
 
     def _check_block_hash(self, block_slot: int, block_hash: Optional[str]) -> str:
         return block_hash or self._generate_fake_block_hash(block_slot)
 
     def _generate_fake_block_time(self, block_slot: int) -> int:
+        block_time = self._fake_block_time_cache.get(block_slot)
+        if block_time is not None:
+            return block_time
+
+        block_time, is_finalized = self._calc_fake_block_time(block_slot)
+        if is_finalized:
+            self._fake_block_time_cache.put(block_slot, block_time)
+        return block_time
+
+    def _calc_block_time_shift(self, slot_cnt: int) -> int:
+        # ceil(slot_cnt * 0.4)
+        return (slot_cnt * self._one_block_sec_num + self._one_block_sec_den - 1) // self._one_block_sec_den
+
+    def _calc_fake_block_time(self, block_slot: int) -> Tuple[int, bool]:
         # Search the nearest block before requested block
         request = f'''
            (SELECT block_slot AS b_block_slot,
                    block_time AS b_block_time,
                    NULL AS n_block_slot,
-                   NULL AS n_block_time
+                   NULL AS n_block_time,
+                   NULL AS n_is_finalized
               FROM {self._table_name}
              WHERE block_slot <= %s
           ORDER BY block_slot DESC LIMIT 1)
@@ -52,7 +89,8 @@ class SolBlocksDB(BaseDB):
           (SELECT NULL AS b_block_slot,
                   NULL AS b_block_time,
                   block_slot AS n_block_slot,
-                  block_time AS n_block_time
+                  block_time AS n_block_time,
+                  is_finalized AS n_is_finalized
               FROM {self._table_name}
              WHERE block_slot >= %s
           ORDER BY block_slot LIMIT 1)
@@ -60,20 +98,26 @@ class SolBlocksDB(BaseDB):
 
         with self._conn.cursor() as cursor:
             cursor.execute(request, (block_slot, block_slot))
-            value_list = cursor.fetchone()
+            value_list_list = cursor.fetchall()
 
-        if value_list is None:
+        if not value_list_list:
             LOG.warning(f'Failed to get nearest blocks for block {block_slot}. Calculate based on genesis')
-            return math.ceil(block_slot * self._one_block_sec) + self._config.genesis_timestamp
+            return self._calc_block_time_shift(block_slot) + self._config.genesis_timestamp, False
+
+        prev_value_list = next((v for v in value_list_list if v[0] is not None), None)
+        next_value_list = next((v for v in value_list_list if v[2] is not None), None)
 
-        nearest_block_slot = value_list[0]
-        if nearest_block_slot is not None:
-            nearest_block_time = value_list[1]
-            return nearest_block_time + math.ceil((block_slot - nearest_block_slot) * self._one_block_sec)
+        # a finalized block after the requested slot means the history around the slot is finalized too
+        is_finalized = (next_value_list is not None) and bool(next_value_list[4])
 
-        nearest_block_slot = value_list[2]
-        nearest_block_time = value_list[3]
-        return nearest_block_time - math.ceil((nearest_block_slot - block_slot) * self._one_block_sec)
+        if prev_value_list is not None:
+            nearest_block_slot, nearest_block_time = prev_value_list[0], prev_value_list[1]
+            block_time = nearest_block_time + self._calc_block_time_shift(block_slot - nearest_block_slot)
+            return block_time, is_finalized
+
+        nearest_block_slot, nearest_block_time = next_value_list[2], next_value_list[3]
+        block_time = nearest_block_time - self._calc_block_time_shift(nearest_block_slot - block_slot)
+        return block_time, is_finalized
 
     def _check_block_time(self, block_slot: int, block_time: Optional[int]) -> int:
         return block_time or self._generate_fake_block_time(block_slot)
@@ -99,79 +143,113 @@ class SolBlocksDB(BaseDB):
                 parent_block_hash=self._generate_fake_block_hash(block_slot-1),
             )
 
+        # the order of _column_list + parent_block_hash
+        value_block_slot, block_hash, block_time, _, is_finalized, _, parent_block_hash = value_list
         if block_slot is None:
-            block_slot = self._get_column_value('block_slot', value_list)
+            block_slot = value_block_slot
         return SolBlockInfo(
             block_slot=block_slot,
-            block_hash=self._check_block_hash(block_slot, self._get_column_value('block_hash', value_list)),
-            block_time=self._check_block_time(block_slot, self._get_column_value('block_time', value_list)),
-            is_finalized=self._get_column_value('is_finalized', value_list),
-            parent_block_hash=self._check_block_hash(block_slot - 1, value_list[6])
+            block_hash=self._check_block_hash(block_slot, block_hash),
+            block_time=self._check_block_time(block_slot, block_time),
+            is_finalized=is_finalized,
+            parent_block_hash=self._check_block_hash(block_slot - 1, parent_block_hash)
         )
 
-    def _build_request(self) -> str:
-        return f'''
-                 SELECT {",".join(['a.' + c for c in self._column_list])},
+    def _prepare_request_list(self) -> None:
+        with self._conn.cursor() as cursor:
+            # Join the parent on its own, so a skipped slot still gets the real parent hash
+            cursor.execute(f'''
+                PREPARE {self._get_block_by_slot_stmt}(BIGINT) AS
+                 SELECT {self._a_column_list_sql},
                         b.block_hash AS parent_block_hash
-                   FROM {self._table_name} AS a
-        FULL OUTER JOIN {self._blocks_table_name} AS b
-                     ON b.block_slot = a.block_slot - 1
+                   FROM (VALUES ($1)) AS r(block_slot)
+        LEFT OUTER JOIN {self._table_name} AS a
+                     ON a.block_slot = r.block_slot
                     AND a.is_active = True
+        LEFT OUTER JOIN {self._table_name} AS b
+                     ON b.block_slot = r.block_slot - 1
                     AND b.is_active = True
-        '''
-
-    def get_block_by_slot(self, block_slot: int, latest_block_slot: int) -> SolBlockInfo:
-        if block_slot > latest_block_slot:
-            return SolBlockInfo(block_slot=block_slot)
+                  WHERE a.block_slot IS NOT NULL
+                     OR b.block_slot IS NOT NULL
+            ''')
 
-        request = f'''
-                (SELECT {",".join(['a.' + c for c in self._column_list])},
+            cursor.execute(f'''
+                PREPARE {self._get_block_by_hash_stmt}(TEXT) AS
+                 SELECT {self._a_column_list_sql},
                         b.block_hash AS parent_block_hash
                    FROM {self._table_name} AS a
         LEFT OUTER JOIN {self._table_name} AS b
-                     ON b.block_slot = %s
+                     ON b.block_slot = a.block_slot - 1
                     AND b.is_active = True
-                  WHERE a.block_slot = %s
+                  WHERE a.block_hash = $1
                     AND a.is_active = True
-                  LIMIT 1)
+            ''')
+
+            # the indexer passes cursors of the same connection, so the statements are available for it
+            cursor.execute(f'''
+                PREPARE {self._finalize_block_list_stmt}(BIGINT[]) AS
+                 UPDATE {self._table_name}
+                    SET is_finalized = True,
+                        is_active = True
+                  WHERE block_slot = ANY($1)
+            ''')
+
+            cursor.execute(f'''
+                PREPARE {self._delete_inactive_block_list_stmt}(BIGINT, BIGINT) AS
+            DELETE FROM {self._table_name}
+                  WHERE block_slot > $1
+                    AND block_slot < $2
+                    AND is_active = False
+            ''')
+
+            cursor.execute(f'''
+                PREPARE {self._deactivate_block_list_stmt}(BIGINT) AS
+                 UPDATE {self._table_name}
+                    SET is_active = False
+                  WHERE block_slot > $1
+            ''')
+
+            cursor.execute(f'''
+                PREPARE {self._activate_block_list_stmt}(BIGINT[]) AS
+                 UPDATE {self._table_name}
+                    SET is_active = True
+                  WHERE block_slot = ANY($1)
+            ''')
+
+    def get_block_by_slot(self, block_slot: int, latest_block_slot: int) -> SolBlockInfo:
+        if block_slot > latest_block_slot:
+            return SolBlockInfo(block_slot=block_slot)
 
-         UNION DISTINCT
+        block = self._finalized_block_by_slot_cache.get(block_slot)
+        if block is not None:
+            return block
 
-                (SELECT {",".join(['a.' + c for c in self._column_list])},
-                        b.block_hash AS parent_block_hash
-                   FROM {self._table_name} AS b
-        LEFT OUTER JOIN {self._table_name} AS a
-                     ON a.block_slot = %s
-                    AND a.is_active = True
-                  WHERE b.block_slot = %s
-                    AND b.is_active = True
-                  LIMIT 1)
-                '''
         with self._conn.cursor() as cursor:
-            cursor.execute(request, (block_slot - 1, block_slot, block_slot, block_slot - 1))
-            return self._block_from_value(block_slot, cursor.fetchone())
+            cursor.execute(f'EXECUTE {self._get_block_by_slot_stmt}(%s)', (block_slot,))
+            block = self._block_from_value(block_slot, cursor.fetchone())
+
+        if block.is_finalized:
+            self._finalized_block_by_slot_cache.put(block_slot, block)
+        return block
 
     def get_block_by_hash(self, block_hash: str, latest_block_slot: int) -> SolBlockInfo:
         fake_block_slot = self._get_fake_block_slot(block_hash)
         if fake_block_slot is not None:
             block = self.get_block_by_slot(fake_block_slot, latest_block_slot)
-            block.set_block_hash(block_hash)  # it can be a request from an uncle history branch
-            return block
+            # it can be a request from an uncle history branch, copy to keep the cached block untouched
+            return replace(block, block_hash=block_hash)
 
-        request = f'''
-                 SELECT {",".join(['a.' + c for c in self._column_list])},
-                        b.block_hash AS parent_block_hash
+        block = self._finalized_block_by_hash_cache.get(block_hash)
+        if block is not None:
+            return block
 
-                   FROM {self._table_name} AS a
-        FULL OUTER JOIN {self._blocks_table_name} AS b
-                     ON b.block_slot = a.block_slot - 1
-                    AND a.is_active = True
-                    AND b.is_active = True
-                  WHERE a.block_hash = %s
-        '''
         with self._conn.cursor() as cursor:
-            cursor.execute(request, (block_hash,))
-            return self._block_from_value(None, cursor.fetchone())
+            cursor.execute(f'EXECUTE {self._get_block_by_hash_stmt}(%s)', (block_hash,))
+            block = self._block_from_value(None, cursor.fetchone())
+
+        if block.is_finalized:
+            self._finalized_block_by_hash_cache.put(block_hash, block)
+        return block
 
     def set_block_list(self, cursor: BaseDB.Cursor, iter_block: Iterator[SolBlockInfo]) -> None:
         value_list_list: List[List[Any]] = []
@@ -184,37 +262,12 @@ class SolBlocksDB(BaseDB):
         self._insert_batch(cursor, value_list_list)
 
     def finalize_block_list(self, cursor: BaseDB.Cursor, base_block_slot: int, block_slot_list: List[int]):
-        cursor.execute(f'''
-            UPDATE {self._table_name}
-               SET is_finalized = True,
-                   is_active = True
-             WHERE block_slot IN ({','.join(["%s" for _ in block_slot_list])})
-            ''',
-            block_slot_list
-        )
-
-        cursor.execute(f'''
-            DELETE FROM {self._table_name}
-                  WHERE block_slot > %s
-                    AND block_slot < %s
-                    AND is_active = False
-            ''',
+        cursor.execute(f'EXECUTE {self._finalize_block_list_stmt}(%s)', (block_slot_list,))
+        cursor.execute(
+            f'EXECUTE {self._delete_inactive_block_list_stmt}(%s, %s)',
             (base_block_slot, block_slot_list[-1])
         )
 
     def activate_block_list(self, cursor: BaseDB.Cursor, base_block_slot: int, block_slot_list: List[int]) -> None:
-        cursor.execute(f'''
-            UPDATE {self._table_name}
-               SET is_active = False
-             WHERE block_slot > %s
-            ''',
-            (base_block_slot,)
-        )
-
-        cursor.execute(f'''
-            UPDATE {self._table_name}
-               SET is_active = True
-             WHERE block_slot IN ({','.join(["%s" for _ in block_slot_list])})
-            ''',
-            block_slot_list
-        )
+        cursor.execute(f'EXECUTE {self._deactivate_block_list_stmt}(%s)', (base_block_slot,))
+        cursor.execute(f'EXECUTE {self._activate_block_list_stmt}(%s)', (block_slot_list,))
@@ -30,7 +30,7 @@ class SolTxCostsDB(BaseDB):
             DELETE FROM {self._table_name}
                   WHERE block_slot > %s
                     AND block_slot < %s
-                    AND block_slot NOT IN ({','.join(["%s" for _ in block_slot_list])})
+                    AND block_slot <> ALL(%s)
             ''',
-            [base_block_slot, block_slot_list[-1]] + block_slot_list
+            (base_block_slot, block_slot_list[-1], block_slot_list)
         )
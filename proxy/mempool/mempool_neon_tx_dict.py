@@ -1,9 +1,10 @@
-import math
+from __future__ import annotations
+
 import time
 
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Deque, Union, Optional
+from typing import Union, Optional
 
 from ..common_neon.errors import EthereumError
 from ..common_neon.eth_proto import NeonTx
@@ -14,26 +15,24 @@ class MPTxDict:
     @dataclass(frozen=True)
     class _Item:
         last_time: int
-        neon_sig: str
         neon_tx: NeonTx
         error: Optional[EthereumError]
 
     def __init__(self, config: Config):
-        self._neon_tx_dict: Dict[str, MPTxDict._Item] = {}
-        self._neon_tx_queue: Deque[MPTxDict._Item] = deque()
+        self._neon_tx_dict: OrderedDict[str, MPTxDict._Item] = OrderedDict()
         self.clear_time_sec: int = config.mempool_cache_life_sec
 
     @staticmethod
     def _get_time() -> int:
-        return math.ceil(time.time())
+        return int(time.monotonic()) + 1
 
     def add(self, neon_sig: str, neon_tx: NeonTx, exc: Optional[BaseException]) -> None:
         now = self._get_time()
         error = EthereumError(str(exc)) if exc is not None else None
 
-        item = MPTxDict._Item(last_time=now, neon_sig=neon_sig, neon_tx=neon_tx, error=error)
-        self._neon_tx_queue.append(item)
+        item = MPTxDict._Item(last_time=now, neon_tx=neon_tx, error=error)
         self._neon_tx_dict[neon_sig] = item
+        self._neon_tx_dict.move_to_end(neon_sig)
 
     def get(self, neon_sig: str) -> Union[NeonTx, EthereumError, None]:
         item = self._neon_tx_dict.get(neon_sig, None)
@@ -44,10 +43,16 @@ class MPTxDict:
         return item.neon_tx
 
     def clear(self) -> None:
-        if len(self._neon_tx_queue) == 0:
+        neon_tx_dict = self._neon_tx_dict
+        if len(neon_tx_dict) == 0:
             return
 
         last_time = max(self._get_time() - self.clear_time_sec, 0)
-        while (len(self._neon_tx_queue) > 0) and (self._neon_tx_queue[0].last_time < last_time):
-            item = self._neon_tx_queue.popleft()
-            self._neon_tx_dict.pop(item.neon_sig, None)
+        expired_cnt = 0
+        for item in neon_tx_dict.values():
+            if item.last_time >= last_time:
+                break
+            expired_cnt += 1
+
+        for _ in range(expired_cnt):
+            neon_tx_dict.popitem(last=False)
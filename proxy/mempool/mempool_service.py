@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 import asyncio
 import logging
 from multiprocessing import Process
-from typing import Any, Optional, cast, Union
+from typing import Any, Optional, Union, Dict, Callable, Awaitable, cast
 
 from .executor_mng import MPExecutorMng, IMPExecutorMngUser
 from .mempool import MemPool
@@ -44,54 +46,94 @@ class MPService(IPickableDataServerUser, IMPExecutorMngUser):
         self._process.start()
 
     async def on_data_received(self, mp_request: Union[MPRequest, MaintenanceRequest]) -> Any:
-        try:
-            if issubclass(type(mp_request), (MPRequest,)):
-                return await self.process_mp_request(cast(MPRequest, mp_request))
-            elif issubclass(type(mp_request), (MaintenanceRequest,)):
-                return self.process_maintenance_request(cast(MaintenanceRequest, mp_request))
-            LOG.error(f"Failed to process mp_request, unknown type: {type(mp_request)}")
-        except BaseException as exc:
-            with logging_context(req_id=mp_request.req_id):
-                LOG.error(f"Failed to process maintenance request: {mp_request.command}.", exc_info=exc)
-                return MPResult("Request failed")
+        if isinstance(mp_request, MPRequest):
+            try:
+                return await self.process_mp_request(mp_request)
+            except BaseException as exc:
+                return self._on_request_failed(mp_request.req_id, f'mempool request: {mp_request.type}', exc)
 
+        elif isinstance(mp_request, MaintenanceRequest):
+            try:
+                return self.process_maintenance_request(mp_request)
+            except BaseException as exc:
+                return self._on_request_failed(mp_request.req_id, f'maintenance request: {mp_request.command}', exc)
+
+        LOG.error(f"Failed to process mp_request, unknown type: {type(mp_request)}")
         return MPResult("Unexpected problem")
 
+    @staticmethod
+    def _on_request_failed(req_id: str, req_name: str, exc: BaseException) -> MPResult:
+        with logging_context(req_id=req_id):
+            LOG.error(f"Failed to process {req_name}.", exc_info=exc)
+        return MPResult("Request failed")
+
+    async def _send_tx(self, mp_request: MPRequest) -> Any:
+        tx_request = cast(MPTxRequest, mp_request)
+        return await self._mempool.schedule_mp_tx_request(tx_request)
+
+    async def _get_pending_tx_nonce(self, mp_request: MPRequest) -> Any:
+        pending_nonce_req = cast(MPPendingTxNonceRequest, mp_request)
+        return self._mempool.get_pending_tx_nonce(pending_nonce_req.sender)
+
+    async def _get_mempool_tx_nonce(self, mp_request: MPRequest) -> Any:
+        mempool_nonce_req = cast(MPMempoolTxNonceRequest, mp_request)
+        return self._mempool.get_last_tx_nonce(mempool_nonce_req.sender)
+
+    async def _get_pending_tx_by_hash(self, mp_request: MPRequest) -> Any:
+        pending_tx_by_hash_req = cast(MPPendingTxByHashRequest, mp_request)
+        return self._mempool.get_pending_tx_by_hash(pending_tx_by_hash_req.tx_hash)
+
+    async def _get_gas_price(self, _: MPRequest) -> Any:
+        return self._mempool.get_gas_price()
+
+    async def _get_elf_param_dict(self, _: MPRequest) -> Any:
+        return self._mempool.get_elf_param_dict()
+
+    _mp_request_handler_dict: Dict[MPRequestType, Callable[[MPService, MPRequest], Awaitable[Any]]] = {
+        MPRequestType.SendTransaction: _send_tx,
+        MPRequestType.GetPendingTxNonce: _get_pending_tx_nonce,
+        MPRequestType.GetMempoolTxNonce: _get_mempool_tx_nonce,
+        MPRequestType.GetTxByHash: _get_pending_tx_by_hash,
+        MPRequestType.GetGasPrice: _get_gas_price,
+        MPRequestType.GetElfParamDict: _get_elf_param_dict
+    }
+
     async def process_mp_request(self, mp_request: MPRequest) -> Any:
         with logging_context(req_id=mp_request.req_id):
-            if mp_request.type == MPRequestType.SendTransaction:
-                tx_request = cast(MPTxRequest, mp_request)
-                return await self._mempool.schedule_mp_tx_request(tx_request)
-            elif mp_request.type == MPRequestType.GetPendingTxNonce:
-                pending_nonce_req = cast(MPPendingTxNonceRequest, mp_request)
-                return self._mempool.get_pending_tx_nonce(pending_nonce_req.sender)
-            elif mp_request.type == MPRequestType.GetMempoolTxNonce:
-                mempool_nonce_req = cast(MPMempoolTxNonceRequest, mp_request)
-                return self._mempool.get_last_tx_nonce(mempool_nonce_req.sender)
-            elif mp_request.type == MPRequestType.GetTxByHash:
-                pending_tx_by_hash_req = cast(MPPendingTxByHashRequest, mp_request)
-                return self._mempool.get_pending_tx_by_hash(pending_tx_by_hash_req.tx_hash)
-            elif mp_request.type == MPRequestType.GetGasPrice:
-                return self._mempool.get_gas_price()
-            elif mp_request.type == MPRequestType.GetElfParamDict:
-                return self._mempool.get_elf_param_dict()
+            handler = self._mp_request_handler_dict.get(mp_request.type, None)
+            if handler is not None:
+                return await handler(self, mp_request)
             LOG.error(f"Failed to process mp_request, unknown type: {mp_request.type}")
 
+    def _suspend_mempool(self, _: MaintenanceRequest) -> MPResult:
+        return self._mempool.suspend_processing()
+
+    def _resume_mempool(self, _: MaintenanceRequest) -> MPResult:
+        return self._mempool.resume_processing()
+
+    def _replicate_requests(self, request: MaintenanceRequest) -> MPResult:
+        repl_req = cast(ReplicationRequest, request)
+        return self._replicator.replicate(repl_req.peers)
+
+    def _replicate_txs_bunch(self, request: MaintenanceRequest) -> MPResult:
+        mp_tx_bunch: ReplicationBunch = cast(ReplicationBunch, request)
+        LOG.info(
+            f"Got replication txs bunch, sender: {mp_tx_bunch.sender_addr}, "
+            f"txs: {len(mp_tx_bunch.mp_tx_requests)}"
+        )
+        return self._replicator.on_mp_tx_bunch(mp_tx_bunch.sender_addr, mp_tx_bunch.mp_tx_requests)
+
+    _maintenance_request_handler_dict: Dict[MaintenanceCommand, Callable[[MPService, MaintenanceRequest], MPResult]] = {
+        MaintenanceCommand.SuspendMemPool: _suspend_mempool,
+        MaintenanceCommand.ResumeMemPool: _resume_mempool,
+        MaintenanceCommand.ReplicateRequests: _replicate_requests,
+        MaintenanceCommand.ReplicateTxsBunch: _replicate_txs_bunch
+    }
+
     def process_maintenance_request(self, request: MaintenanceRequest) -> MPResult:
-        if request.command == MaintenanceCommand.SuspendMemPool:
-            return self._mempool.suspend_processing()
-        elif request.command == MaintenanceCommand.ResumeMemPool:
-            return self._mempool.resume_processing()
-        elif request.command == MaintenanceCommand.ReplicateRequests:
-            repl_req = cast(ReplicationRequest, request)
-            return self._replicator.replicate(repl_req.peers)
-        elif request.command == MaintenanceCommand.ReplicateTxsBunch:
-            mp_tx_bunch: ReplicationBunch = cast(ReplicationBunch, request)
-            LOG.info(
-                f"Got replication txs bunch, sender: {mp_tx_bunch.sender_addr}, "
-                f"txs: {len(mp_tx_bunch.mp_tx_requests)}"
-            )
-            return self._replicator.on_mp_tx_bunch(mp_tx_bunch.sender_addr, mp_tx_bunch.mp_tx_requests)
+        handler = self._maintenance_request_handler_dict.get(request.command, None)
+        if handler is not None:
+            return handler(self, request)
         LOG.error(f"Failed to process maintenance mp_reqeust, unknown command: {request.command}")
 
     def run(self):
@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 import math
 import threading
 import multiprocessing
 import time
 import logging
+from functools import lru_cache
 from typing import Optional, Union, Dict, Any, List, cast
 
 import eth_utils
@@ -22,7 +25,7 @@ from ..common_neon.keys_storage import KeyStorage
 from ..common_neon.solana_tx import SolCommit
 from ..common_neon.solana_interactor import SolInteractor
 from ..common_neon.transaction_validator import NeonTxValidator
-from ..common_neon.utils import SolBlockInfo, NeonTxReceiptInfo, NeonTxInfo, NeonTxResultInfo
+from ..common_neon.utils import SolBlockInfo, NeonTxReceiptInfo, NeonTxInfo, NeonTxResultInfo, LRUDict
 
 from ..indexer.indexer_db import IndexerDB
 
@@ -32,6 +35,10 @@ NEON_PROXY_PKG_VERSION = '0.15.17'
 NEON_PROXY_REVISION = 'NEON_PROXY_REVISION_TO_BE_REPLACED'
 LOG = logging.getLogger(__name__)
 
+_EMPTY_LOGS_BLOOM = '0x' + '0' * 512
+_FAKE_ROOT_HASH = '0x' + '0' * 63 + '1'
+_ZERO_ADDRESS = '0x' + '0' * 40
+
 
 def get_req_id_from_log():
     th = threading.current_thread()
@@ -41,6 +48,7 @@ def get_req_id_from_log():
 
 class NeonRpcApiWorker:
     proxy_id_glob = multiprocessing.Value('i', 0)
+    _finalized_tx_cache_size = 4096
 
     def __init__(self, config: Config):
         self._config = config
@@ -53,6 +61,12 @@ class NeonRpcApiWorker:
 
         self._last_elf_params_time = 0
 
+        self._finalized_block_slot_value = 0
+        self._last_finalized_block_slot_time = 0
+
+        # keeps only receipts of finalized txs, so there is nothing to invalidate
+        self._finalized_tx_cache: LRUDict[str, NeonTxReceiptInfo] = LRUDict(self._finalized_tx_cache_size)
+
         with self.proxy_id_glob.get_lock():
             self.proxy_id = self.proxy_id_glob.value
             self.proxy_id_glob.value += 1
@@ -68,10 +82,19 @@ class NeonRpcApiWorker:
             gas_price = self._mempool_client.get_gas_price(get_req_id_from_log())
             if gas_price is not None:
                 self._gas_price_value = gas_price
+                self._last_gas_price_time = now
         if self._gas_price_value is None:
             raise EthereumError(message='Failed to calculate gas price. Try again later')
         return cast(MPGasPriceResult, self._gas_price_value)
 
+    @property
+    def _finalized_block_slot(self) -> int:
+        now = math.ceil(time.time())
+        if self._last_finalized_block_slot_time != now:
+            self._finalized_block_slot_value = self._db.get_finalized_block_slot()
+            self._last_finalized_block_slot_time = now
+        return self._finalized_block_slot_value
+
     def neon_proxy_version(self) -> str:
         return self.neon_proxyVersion()
 
@@ -200,10 +223,16 @@ class NeonRpcApiWorker:
             bin_address = bytes.fromhex(address)
             assert len(bin_address) == 20
 
-            return eth_utils.to_checksum_address(address)
+            return NeonRpcApiWorker._checksum_address(address)
         except (Exception,):
             raise InvalidParamError(message=error)
 
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _checksum_address(address: str) -> str:
+        # wallets poll the same addresses, don't calculate keccak for each request
+        return eth_utils.to_checksum_address(address)
+
     def _get_full_block_by_number(self, tag: Union[str, int]) -> SolBlockInfo:
         block = self._process_block_tag(tag)
         if block.is_empty():
@@ -376,6 +405,13 @@ class NeonRpcApiWorker:
         log_list = self._get_logs(obj)
         return self._filter_log_list(log_list, True)
 
+    @staticmethod
+    def _decode_gas_used(gas_used: str) -> int:
+        try:
+            return int(gas_used, 16)
+        except ValueError:
+            return 0
+
     def _get_block_by_slot(self, block: SolBlockInfo, full: bool, skip_transaction: bool) -> Optional[dict]:
         if block.is_empty():
             block = self._db.get_block_by_slot(block.block_slot)
@@ -384,40 +420,33 @@ class NeonRpcApiWorker:
 
         sig_list = []
         gas_used = 0
-        if skip_transaction:
-            tx_list = []
-        else:
-            tx_list = self._db.get_tx_list_by_block_slot(block.block_slot)
-
-        for tx in tx_list:
-            try:
-                gas_used += int(tx.neon_tx_res.gas_used, 16)
-            except ValueError:
-                pass
-
-            if full:
-                receipt = self._get_transaction(tx)
-                sig_list.append(receipt)
-            else:
-                sig_list.append(tx.neon_tx.sig)
+        if full and (not skip_transaction):
+            for tx in self._db.get_tx_list_by_block_slot(block.block_slot):
+                gas_used += self._decode_gas_used(tx.neon_tx_res.gas_used)
+                sig_list.append(self._get_transaction(tx))
+        elif not skip_transaction:
+            # only signatures are needed, skip reading and decoding the full receipts
+            for neon_sig, tx_gas_used in self._db.get_tx_sig_gas_list_by_block_slot(block.block_slot):
+                gas_used += self._decode_gas_used(tx_gas_used)
+                sig_list.append(neon_sig)
 
         result = {
             "difficulty": '0x0',
             "totalDifficulty": '0x0',
-            "extraData": "0x" + '0' * 63 + '1',
-            "logsBloom": '0x' + '0' * 512,
+            "extraData": _FAKE_ROOT_HASH,
+            "logsBloom": _EMPTY_LOGS_BLOOM,
             "gasLimit": '0xec8563e271ac',
-            "transactionsRoot": '0x' + '0' * 63 + '1',
-            "receiptsRoot": '0x' + '0' * 63 + '1',
-            "stateRoot": '0x' + '0' * 63 + '1',
+            "transactionsRoot": _FAKE_ROOT_HASH,
+            "receiptsRoot": _FAKE_ROOT_HASH,
+            "stateRoot": _FAKE_ROOT_HASH,
 
             "uncles": [],
             "sha3Uncles": '0x1dcc4de8dec75d7aab85b567b6ccd41ad312451b948a7413f0a142fd40d49347',
 
-            "miner": '0x' + '0' * 40,
+            "miner": _ZERO_ADDRESS,
             # 8 byte nonce
             "nonce": '0x0000000000000000',
-            "mixHash": '0x' + '0' * 63 + '1',
+            "mixHash": _FAKE_ROOT_HASH,
             "size": '0x' + '1',
 
             "gasUsed": hex(gas_used),
@@ -506,7 +535,7 @@ class NeonRpcApiWorker:
             raise InvalidParamError(message="missing data")
 
         try:
-            caller_id = obj.get('from', "0x0000000000000000000000000000000000000000")
+            caller_id = obj.get('from', _ZERO_ADDRESS)
             contract_id = obj.get('to', 'deploy')
             data = obj.get('data', "None")
             value = obj.get('value', '')
@@ -568,7 +597,8 @@ class NeonRpcApiWorker:
             return hex(0)
 
     def _fill_transaction_receipt_answer(self, tx: NeonTxReceiptInfo, with_hidden: bool) -> dict:
-        log_list = self._filter_log_list(tx.neon_tx_res.log_list, with_hidden)
+        # the receipt can be stored in the cache of finalized txs, so don't change its records
+        log_list = self._filter_log_list([dict(log_rec) for log_rec in tx.neon_tx_res.log_list], with_hidden)
 
         result = {
             "transactionHash": tx.neon_tx.sig,
@@ -583,15 +613,29 @@ class NeonRpcApiWorker:
             "contractAddress": tx.neon_tx.contract,
             "logs": log_list,
             "status": tx.neon_tx_res.status,
-            "logsBloom": "0x" + '0' * 512
+            "logsBloom": _EMPTY_LOGS_BLOOM
         }
 
         return result
 
+    def _get_tx_by_neon_sig(self, neon_sig: str) -> Optional[NeonTxReceiptInfo]:
+        tx = self._finalized_tx_cache.get(neon_sig)
+        if tx is not None:
+            return tx
+
+        tx = self._db.get_tx_by_neon_sig(neon_sig)
+        if tx is None:
+            return None
+
+        # the finalized slot can be up to 1 second old, it only delays caching of the tx
+        if tx.neon_tx_res.block_slot <= self._finalized_block_slot:
+            self._finalized_tx_cache.put(neon_sig, tx)
+        return tx
+
     def _get_transaction_receipt(self, neon_tx_sig: str) -> Optional[NeonTxReceiptInfo]:
         neon_sig = self._normalize_tx_id(neon_tx_sig)
 
-        tx = self._db.get_tx_by_neon_sig(neon_sig)
+        tx = self._get_tx_by_neon_sig(neon_sig)
         if not tx:
             neon_tx_or_error = self._mempool_client.get_pending_tx_by_hash(get_req_id_from_log(), neon_tx_sig)
             if isinstance(neon_tx_or_error, EthereumError):
@@ -647,7 +691,7 @@ class NeonRpcApiWorker:
     def eth_getTransactionByHash(self, neon_tx_sig: str) -> Optional[dict]:
         neon_sig = self._normalize_tx_id(neon_tx_sig)
 
-        neon_tx_receipt: NeonTxReceiptInfo = self._db.get_tx_by_neon_sig(neon_sig)
+        neon_tx_receipt: NeonTxReceiptInfo = self._get_tx_by_neon_sig(neon_sig)
         if neon_tx_receipt is None:
             neon_tx: Union[NeonTx, EthereumError, None] = self._mempool_client.get_pending_tx_by_hash(
                 get_req_id_from_log(), neon_sig)
@@ -675,7 +719,7 @@ class NeonRpcApiWorker:
 
     def eth_sendRawTransaction(self, raw_tx: str) -> str:
         try:
-            neon_tx = NeonTx.from_string(bytearray.fromhex(raw_tx[2:]))
+            neon_tx = NeonTx.from_string(bytes.fromhex(raw_tx[2:]))
         except (Exception,):
             raise InvalidParamError(message="wrong transaction format")
 
@@ -689,10 +733,11 @@ class NeonRpcApiWorker:
             return result
 
         neon_tx_sig = neon_tx.hex_tx_sig
-        LOG.debug(f'sendRawTransaction {neon_tx_sig}: {_readable_tx(neon_tx)}')
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(f'sendRawTransaction {neon_tx_sig}: {_readable_tx(neon_tx)}')
 
         try:
-            neon_tx_receipt: NeonTxReceiptInfo = self._db.get_tx_by_neon_sig(neon_tx_sig)
+            neon_tx_receipt: NeonTxReceiptInfo = self._get_tx_by_neon_sig(neon_tx_sig)
             if neon_tx_receipt is not None:
                 raise EthereumError(message='already known')
 
@@ -921,6 +966,7 @@ class NeonRpcApiWorker:
             if elf_param_dict is None:
                 raise EthereumError(message='Failed to read Neon EVM params from Solana cluster. Try again later')
             elf_params.set_elf_param_dict(elf_param_dict)
+            self._last_elf_params_time = now
 
         always_allowed_method_set = {
             "eth_chainId",
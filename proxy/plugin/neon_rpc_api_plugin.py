@@ -15,6 +15,7 @@ import threading
 import time
 import urllib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict, Any, Optional
 
 from ..common.utils import build_http_response
@@ -36,6 +37,7 @@ modelInstanceLock = threading.Lock()
 configInstance: Optional[Config] = None
 statInstance: Optional[ProxyStatClient] = None
 modelInstance: Optional[NeonRpcApiWorker] = None
+batchPoolInstance: Optional[ThreadPoolExecutor] = None
 
 
 LOG = logging.getLogger(__name__)
@@ -45,6 +47,7 @@ class NeonRpcApiPlugin(HttpWebServerBasePlugin):
     """Extend in-built Web Server to add Reverse Proxy capabilities.
     """
     SOLANA_PROXY_LOCATION: str = r'/solana$'
+    BATCH_POOL_SIZE: int = 32
 
     def __init__(self, *args):
         HttpWebServerBasePlugin.__init__(self, *args)
@@ -65,6 +68,16 @@ class NeonRpcApiPlugin(HttpWebServerBasePlugin):
                 modelInstance = NeonRpcApiWorker(configInstance)
             return configInstance, statInstance, modelInstance
 
+    @classmethod
+    def getBatchPool(cls) -> ThreadPoolExecutor:
+        global modelInstanceLock
+        global batchPoolInstance
+
+        with modelInstanceLock:
+            if batchPoolInstance is None:
+                batchPoolInstance = ThreadPoolExecutor(max_workers=cls.BATCH_POOL_SIZE)
+            return batchPoolInstance
+
     def routes(self) -> List[Tuple[int, str]]:
         return [
             (httpProtocolTypes.HTTP, NeonRpcApiPlugin.SOLANA_PROXY_LOCATION),
@@ -128,13 +141,26 @@ class NeonRpcApiPlugin(HttpWebServerBasePlugin):
 
         return response
 
+    def _process_batch_request(self, req_id: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        with logging_context(req_id=req_id):
+            return self._process_request(request)
+
+    def _process_batch(self, req_id: str, request_list: List[Any]) -> List[Dict[str, Any]]:
+        if len(request_list) == 1:
+            return [self._process_request(request_list[0])]
+
+        # requests are dominated by I/O to Solana/DB, so process them concurrently; keep the order of responses
+        batch_pool = self.getBatchPool()
+        future_list = [batch_pool.submit(self._process_batch_request, req_id, r) for r in request_list]
+        return [future.result() for future in future_list]
+
     def handle_request(self, request: HttpParser) -> None:
         req_id = gen_unique_id()
         with logging_context(req_id=req_id):
-            self._handle_request_impl(request)
+            self._handle_request_impl(req_id, request)
             LOG.info("Request processed")
 
-    def _handle_request_impl(self, request: HttpParser) -> None:
+    def _handle_request_impl(self, req_id: str, request: HttpParser) -> None:
         if request.method == b'OPTIONS':
             self.client.queue(memoryview(build_http_response(
                 httpStatusCodes.OK, reason=b'OK', body=None,
@@ -161,11 +187,9 @@ class NeonRpcApiPlugin(HttpWebServerBasePlugin):
             )
             # request = json.loads(request.body)
             if isinstance(request, list):
-                response = []
                 if len(request) == 0:
                     raise Exception("Empty batch request")
-                for r in request:
-                    response.append(self._process_request(r))
+                response = self._process_batch(req_id, request)
             elif isinstance(request, dict):
                 response = self._process_request(request)
             else:
@@ -174,7 +198,7 @@ class NeonRpcApiPlugin(HttpWebServerBasePlugin):
             response = {'jsonrpc': '2.0', 'error': {'code': -32000, 'message': str(err)}}
 
         self.client.queue(memoryview(build_http_response(
-            httpStatusCodes.OK, reason=b'OK', body=json.dumps(response).encode('utf8'),
+            httpStatusCodes.OK, reason=b'OK', body=json.dumps(response, separators=(',', ':')).encode('utf8'),
             headers={
                 b'Content-Type': b'application/json',
                 b'Access-Control-Allow-Origin': b'*',
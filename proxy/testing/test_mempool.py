@@ -12,14 +12,17 @@ from unittest.mock import patch, MagicMock, call
 
 from ..common_neon.config import Config
 from ..common_neon.data import NeonTxExecCfg
+from ..common_neon.errors import EthereumError
 from ..common_neon.solana_tx import SolPubKey
 
 from ..mempool.executor_mng import MPExecutorMng
 from ..mempool.mempool import MemPool, MPTask, MPTxRequestList
-from ..mempool.mempool_api import MPRequest, OpResIdent
+from ..mempool.mempool_api import MPRequest, MPRequestType, MPResult, OpResIdent
 from ..mempool.mempool_api import MPTxRequest, MPTxExecRequest, MPTxExecResult, MPTxExecResultCode, MPTxSendResult
 from ..mempool.mempool_api import MPGasPriceResult, MPSenderTxCntData, MPTxSendResultCode
 from ..mempool.mempool_schedule import MPTxSchedule, MPSenderTxPool
+from ..mempool.mempool_neon_tx_dict import MPTxDict
+from ..mempool.mempool_service import MPService
 from ..common_neon.eth_proto import NeonTx
 from ..common_neon.elf_params import ElfParams
 
@@ -367,6 +370,32 @@ class TestMemPool(unittest.IsolatedAsyncioTestCase):
         self._mempool._tx_schedule.set_sender_state_tx_cnt_list(sender_tx_cnt_list)
 
 
+class TestMPService(unittest.TestCase):
+    def setUp(self) -> None:
+        self._service = MPService(FakeConfig())
+
+    def tearDown(self) -> None:
+        self._service._event_loop.close()
+        asyncio.set_event_loop(None)
+
+    def _on_data_received(self, request: Any) -> Any:
+        return self._service._event_loop.run_until_complete(self._service.on_data_received(request))
+
+    @patch.object(MPService, 'process_mp_request', side_effect=Exception('test error'))
+    def test_failed_mp_request(self, process_mp_request_mock: MagicMock):
+        """Checks if a failed mp_request is reported as a failed result"""
+        mp_req = MPRequest(req_id='0000001', type=MPRequestType.GetGasPrice)
+        result = self._on_data_received(mp_req)
+
+        process_mp_request_mock.assert_called_once_with(mp_req)
+        self.assertEqual(result, MPResult('Request failed'))
+
+    def test_unknown_request(self):
+        """Checks if a request of an unknown type is rejected"""
+        result = self._on_data_received('unknown request')
+        self.assertEqual(result, MPResult('Unexpected problem'))
+
+
 class TestMPSchedule(unittest.TestCase):
     def test_capacity_oversized_simple(self):
         """Checks if mp_schedule gets oversized in simple way"""
@@ -570,6 +599,65 @@ class TestMPSchedule(unittest.TestCase):
         self.assertNotIn(tx.sig, schedule._tx_dict._tx_hash_dict)
 
 
+class TestMPTxDict(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tx_dict = MPTxDict(FakeConfig())
+        self._life_sec = self._tx_dict.clear_time_sec
+        req_data_list = [
+            dict(req_id='000', nonce=0, gas_price=30000, gas=10, value=1),
+            dict(req_id='001', nonce=0, gas_price=30000, gas=10, value=1)
+        ]
+        self._req_list = [create_transfer_mp_request(**req) for req in req_data_list]
+
+    def _add_tx(self, req: MPTxExecRequest, now: int, exc: Optional[BaseException] = None) -> None:
+        with patch.object(MPTxDict, '_get_time', return_value=now):
+            self._tx_dict.add(req.sig, req.neon_tx, exc)
+
+    def _clear(self, now: int) -> None:
+        with patch.object(MPTxDict, '_get_time', return_value=now):
+            self._tx_dict.clear()
+
+    def test_add_get(self):
+        """Checks if added txs and errors are returned by signature"""
+        self._add_tx(self._req_list[0], 100)
+        self._add_tx(self._req_list[1], 100, Exception('test error'))
+
+        self.assertIs(self._tx_dict.get(self._req_list[0].sig), self._req_list[0].neon_tx)
+        error = self._tx_dict.get(self._req_list[1].sig)
+        self.assertIsInstance(error, EthereumError)
+        self.assertIn('test error', str(error))
+        self.assertIsNone(self._tx_dict.get('0x' + '0' * 64))
+
+    def test_expire(self):
+        """Checks if only txs older than the cache life are dropped"""
+        self._add_tx(self._req_list[0], 100)
+        self._add_tx(self._req_list[1], 101)
+
+        self._clear(100 + self._life_sec)
+        self.assertIsNotNone(self._tx_dict.get(self._req_list[0].sig))
+        self.assertIsNotNone(self._tx_dict.get(self._req_list[1].sig))
+
+        self._clear(101 + self._life_sec)
+        self.assertIsNone(self._tx_dict.get(self._req_list[0].sig))
+        self.assertIsNotNone(self._tx_dict.get(self._req_list[1].sig))
+
+        self._clear(102 + self._life_sec)
+        self.assertIsNone(self._tx_dict.get(self._req_list[1].sig))
+
+    def test_readd(self):
+        """Checks if a re-added tx gets a new life time"""
+        self._add_tx(self._req_list[0], 100)
+        self._add_tx(self._req_list[1], 101)
+        self._add_tx(self._req_list[0], 102, Exception('test error'))
+
+        self._clear(102 + self._life_sec)
+        self.assertIsNone(self._tx_dict.get(self._req_list[1].sig))
+        self.assertIsInstance(self._tx_dict.get(self._req_list[0].sig), EthereumError)
+
+        self._clear(103 + self._life_sec)
+        self.assertIsNone(self._tx_dict.get(self._req_list[0].sig))
+
+
 class TestMPSenderTxPool(unittest.TestCase):
     def setUp(self) -> None:
         self._pool = MPSenderTxPool()
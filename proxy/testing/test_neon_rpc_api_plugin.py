@@ -0,0 +1,66 @@
+import json
+import threading
+import time
+import unittest
+from typing import Dict, Any
+from unittest.mock import patch, MagicMock
+
+from ..plugin.neon_rpc_api_plugin import NeonRpcApiPlugin
+
+
+class TestNeonRpcApiPlugin(unittest.TestCase):
+    def setUp(self) -> None:
+        # skip the constructor, it starts the statistic client and connects to the DB
+        self._plugin = NeonRpcApiPlugin.__new__(NeonRpcApiPlugin)
+        self._plugin.client = MagicMock()
+        self._plugin._model = MagicMock()
+        self._thread_dict: Dict[int, int] = dict()
+        self._req_id_dict: Dict[int, str] = dict()
+
+    def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        req_id = request['id']
+        # the first request is the slowest one
+        time.sleep(0.05 * (3 - req_id))
+        self._thread_dict[req_id] = threading.get_ident()
+        self._req_id_dict[req_id] = getattr(threading.current_thread(), 'log_context', {}).get('req_id')
+        if request['method'] == 'eth_fail':
+            raise Exception('failed request')
+        return {'jsonrpc': '2.0', 'id': req_id, 'result': hex(req_id)}
+
+    def _handle_request(self, request_list: Any) -> Any:
+        request = MagicMock()
+        request.method = b'POST'
+        request.body = json.dumps(request_list).encode('utf8')
+
+        with patch.object(self._plugin, '_process_request', side_effect=self._process_request):
+            self._plugin._handle_request_impl('test-req-id', request)
+
+        response = bytes(self._plugin.client.queue.call_args[0][0])
+        return json.loads(response.split(b'\r\n\r\n', 1)[1])
+
+    def test_batch_order(self):
+        """Checks if responses of the batch request are in the order of requests"""
+        request_list = [{'jsonrpc': '2.0', 'id': i, 'method': 'eth_chainId'} for i in range(3)]
+
+        response_list = self._handle_request(request_list)
+        self.assertEqual([r['id'] for r in response_list], [0, 1, 2])
+        self.assertEqual([r['result'] for r in response_list], ['0x0', '0x1', '0x2'])
+        self.assertNotIn(threading.get_ident(), self._thread_dict.values())
+        self.assertEqual(set(self._req_id_dict.values()), {'test-req-id'})
+
+    def test_one_element_batch(self):
+        """Checks if the batch request with one element is processed in the calling thread"""
+        response_list = self._handle_request([{'jsonrpc': '2.0', 'id': 1, 'method': 'eth_chainId'}])
+        self.assertEqual(response_list, [{'jsonrpc': '2.0', 'id': 1, 'result': '0x1'}])
+        self.assertEqual(self._thread_dict[1], threading.get_ident())
+
+    def test_batch_exception(self):
+        """Checks if an exception in one element fails the whole batch request, as in the sequential processing"""
+        request_list = [
+            {'jsonrpc': '2.0', 'id': 0, 'method': 'eth_chainId'},
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'eth_fail'},
+            {'jsonrpc': '2.0', 'id': 2, 'method': 'eth_chainId'}
+        ]
+
+        response = self._handle_request(request_list)
+        self.assertEqual(response, {'jsonrpc': '2.0', 'error': {'code': -32000, 'message': 'failed request'}})
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+
+from ..common_neon.config import Config
+from ..common_neon.utils import NeonTxReceiptInfo, NeonTxInfo, NeonTxResultInfo
+from ..neon_rpc_api_model import neon_rpc_api_worker
+from ..neon_rpc_api_model.neon_rpc_api_worker import NeonRpcApiWorker
+
+
+class TestNeonRpcApiWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch.object(neon_rpc_api_worker, 'IndexerDB') as db_mock, \
+                patch.object(neon_rpc_api_worker, 'MemPoolClient'), \
+                patch.object(neon_rpc_api_worker, 'SolInteractor'):
+            self._db = db_mock.return_value
+            self._worker = NeonRpcApiWorker(Config())
+
+    @staticmethod
+    def _create_tx(block_slot: int) -> NeonTxReceiptInfo:
+        neon_tx_res = NeonTxResultInfo(block_slot=block_slot, block_hash='0x' + 'a' * 64, tx_idx=0)
+        neon_tx_res.log_list.append({'address': '0x' + '1' * 40, 'data': '', 'neonEventType': 1})
+        return NeonTxReceiptInfo(neon_tx=NeonTxInfo(sig='0x' + 'b' * 64), neon_tx_res=neon_tx_res)
+
+    def test_not_finalized_tx(self):
+        """Checks if a tx from a not finalized block is never cached"""
+        self._db.get_tx_by_neon_sig.return_value = self._create_tx(10)
+        self._db.get_finalized_block_slot.return_value = 9
+
+        self._worker._get_tx_by_neon_sig('0x' + 'b' * 64)
+        self._worker._get_tx_by_neon_sig('0x' + 'b' * 64)
+        self.assertEqual(self._db.get_tx_by_neon_sig.call_count, 2)
+
+    def test_finalized_tx(self):
+        """Checks if a tx from a finalized block is read from the DB only once"""
+        tx = self._create_tx(10)
+        self._db.get_tx_by_neon_sig.return_value = tx
+        self._db.get_finalized_block_slot.return_value = 10
+
+        self.assertIs(self._worker._get_tx_by_neon_sig('0x' + 'b' * 64), tx)
+        self.assertIs(self._worker._get_tx_by_neon_sig('0x' + 'b' * 64), tx)
+        self.assertEqual(self._db.get_tx_by_neon_sig.call_count, 1)
+
+    def test_receipt_keeps_cached_logs(self):
+        """Checks if receipt answers don't change the logs of the cached tx"""
+        self._db.get_tx_by_neon_sig.return_value = self._create_tx(10)
+        self._db.get_finalized_block_slot.return_value = 10
+
+        eth_receipt = self._worker.eth_getTransactionReceipt('0x' + 'b' * 64)
+        self.assertNotIn('neonEventType', eth_receipt['logs'][0])
+
+        neon_receipt = self._worker.neon_getTransactionReceipt('0x' + 'b' * 64)
+        self.assertEqual(neon_receipt['logs'][0]['neonEventType'], 'LOG')
+        self.assertEqual(self._db.get_tx_by_neon_sig.call_count, 1)
+
+    def test_logs_are_not_copied(self):
+        """Checks if eth_getLogs filters the records from the DB in place"""
+        log_rec = {'address': '0x' + '1' * 40, 'data': '', 'neonEventType': 1}
+        log_list = self._worker._filter_log_list([log_rec], False)
+        self.assertIs(log_list[0], log_rec)
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from ..indexer.solana_blocks_db import SolBlocksDB
+
+
+class TestSolBlocksDB(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch('psycopg2.connect') as connect_mock:
+            self._conn = connect_mock.return_value
+            self._cursor = MagicMock()
+            self._conn.cursor.return_value.__enter__.return_value = self._cursor
+            self._db = SolBlocksDB(MagicMock())
+        self._cursor.reset_mock()
+
+    @staticmethod
+    def _block_value_list(block_slot: int, is_finalized: bool) -> list:
+        # the order of the columns + parent_block_hash
+        return [block_slot, '0x' + 'a' * 64, 100, block_slot - 1, is_finalized, True, '0x' + 'b' * 64]
+
+    def test_finalized_block_by_slot(self):
+        """Checks if a finalized block is read from the DB only once"""
+        self._cursor.fetchone.return_value = self._block_value_list(10, True)
+
+        block = self._db.get_block_by_slot(10, 20)
+        self.assertTrue(block.is_finalized)
+        self.assertIs(self._db.get_block_by_slot(10, 20), block)
+        self.assertEqual(self._cursor.execute.call_count, 1)
+
+    def test_not_finalized_block_by_slot(self):
+        """Checks if a not finalized block is never cached"""
+        self._cursor.fetchone.return_value = self._block_value_list(10, False)
+
+        self._db.get_block_by_slot(10, 20)
+        self._db.get_block_by_slot(10, 20)
+        self.assertEqual(self._cursor.execute.call_count, 2)
+
+    def test_not_finalized_block_by_hash(self):
+        """Checks if a not finalized block is never cached by hash"""
+        self._cursor.fetchone.return_value = self._block_value_list(10, False)
+
+        block_hash = '0x' + 'a' * 64
+        self.assertEqual(self._db.get_block_by_hash(block_hash, 20).block_slot, 10)
+        self._db.get_block_by_hash(block_hash, 20)
+        self.assertEqual(self._cursor.execute.call_count, 2)
+
+    def test_not_finalized_fake_block_time(self):
+        """Checks if a fake time near not finalized blocks is never cached"""
+        # nearest blocks: before 5 with time 100, after 15 not finalized
+        self._cursor.fetchall.return_value = [[5, 100, None, None, None], [None, None, 15, 104, False]]
+
+        self.assertEqual(self._db._generate_fake_block_time(10), 102)
+        self._db._generate_fake_block_time(10)
+        self.assertEqual(self._cursor.execute.call_count, 2)
+
+        self._cursor.fetchall.return_value = [[5, 100, None, None, None], [None, None, 15, 104, True]]
+        self._db._generate_fake_block_time(10)
+        self._db._generate_fake_block_time(10)
+        self.assertEqual(self._cursor.execute.call_count, 3)
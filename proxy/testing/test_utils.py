@@ -1,5 +1,5 @@
 import unittest
-from ..common_neon.utils import get_from_dict
+from ..common_neon.utils import get_from_dict, LRUDict
 
 
 class TestUtils(unittest.TestCase):
@@ -14,3 +14,22 @@ class TestUtils(unittest.TestCase):
         self.assertIsNone(get_from_dict(None, "a"))
         self.assertIsNone(get_from_dict(555, "a"))
         self.assertIsNone(get_from_dict({}, "a"))
+
+    def test_lru_dict(self):
+        lru_dict: LRUDict[int, str] = LRUDict(2)
+        lru_dict.put(1, 'a')
+        lru_dict.put(2, 'b')
+        self.assertEqual('a', lru_dict.get(1))
+
+        # 1 is used recently, so 2 is dropped
+        lru_dict.put(3, 'c')
+        self.assertEqual(2, len(lru_dict))
+        self.assertIsNone(lru_dict.get(2))
+        self.assertEqual('a', lru_dict.get(1))
+        self.assertEqual('c', lru_dict.get(3))
+
+        # update moves the key to the end too
+        lru_dict.put(1, 'd')
+        lru_dict.put(4, 'e')
+        self.assertIsNone(lru_dict.get(3))
+        self.assertEqual('d', lru_dict.get(1))